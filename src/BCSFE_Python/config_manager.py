@@ -8,6 +8,9 @@ import yaml
 
 from . import helper, user_input_handler, locale_handler
 
+config_cache: dict[str, tuple[int, dict[str, Any]]] = {}
+config_path_cache: Optional[str] = None
+
 
 def get_config_value_category(category: str, key: str) -> Any:
     """
@@ -33,8 +36,13 @@ def get_config_file() -> dict[str, Any]:
         dict: Config file
     """
     config_file = get_config_path()
+    modified_time = os.stat(config_file).st_mtime_ns
+    cached = config_cache.get(config_file)
+    if cached is not None and cached[0] == modified_time:
+        return cached[1]
     with open(config_file, "r", encoding="utf-8") as file:
         config = yaml.safe_load(file)
+    config_cache[config_file] = (modified_time, config)
     return config
 
 
@@ -45,6 +53,9 @@ def get_config_path() -> str:
     Returns:
         str: Path to config file
     """
+    global config_path_cache
+    if config_path_cache is not None and os.path.exists(config_path_cache):
+        return config_path_cache
     config_path_path = helper.get_file("config_path.txt")
     helper.create_dirs(os.path.dirname(config_path_path))
     if not os.path.exists(config_path_path):
@@ -55,6 +66,7 @@ def get_config_path() -> str:
         config_path = os.path.join(get_app_data_folder(), "config.yaml")
     if not os.path.exists(config_path):
         create_config_file(config_path)
+    config_path_cache = config_path
     return config_path
 
 
@@ -65,7 +77,9 @@ def set_config_path(path: str):
     Args:
         path (str): Path to config file
     """
+    global config_path_cache
     helper.write_file_string(helper.get_file("config_path.txt"), path)
+    config_path_cache = None
     if not os.path.exists(path):
         create_config_file()
 
@@ -100,6 +114,7 @@ def set_config_setting_category(category: str, key: str, value: Any) -> None:
     config[category][key] = value
     with open(get_config_path(), "w", encoding="utf-8") as file:
         yaml.safe_dump(config, file)
+    config_cache.clear()
 
 
 def set_config_setting(setting: str, value: Any) -> None:
@@ -114,6 +129,7 @@ def set_config_setting(setting: str, value: Any) -> None:
     config[setting] = value
     with open(get_config_path(), "w", encoding="utf-8") as file:
         yaml.safe_dump(config, file)
+    config_cache.clear()
 
 
 def create_config_file(config_path: Optional[str] = None) -> None:
@@ -157,6 +173,7 @@ SERVER:
 """
 
     helper.write_file_string(config_file, file_data)
+    config_cache.clear()
 
 
 def get_app_data_folder() -> str:
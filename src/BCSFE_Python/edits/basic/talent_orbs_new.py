@@ -27,6 +27,14 @@ class RawOrbInfo:
         self.value = value
         self.attribute_id = attribute_id
 
+    def get_sort_key(self) -> tuple[int, int, int, int]:
+        """Get the key to sort orbs by attribute, effect, grade and id in that order
+
+        Returns:
+            tuple[int, int, int, int]: The sort key
+        """
+        return (self.attribute_id, self.effect_id, self.grade_id, self.orb_id)
+
 
 class OrbInfo:
     def __init__(
@@ -336,22 +344,18 @@ class SaveOrbs:
 
     def print(self):
         """Print the orbs as a formatted list"""
-        self.sort_orbs()
-        helper.colored_text(
-            f"Total current orbs: &{sum([orb.count for orb in self.orbs.values()])}&"
-        )
-        helper.colored_text(f"Total current types: &{len(self.orbs)}&")
+        orbs = self.sort_orbs()
+        helper.colored_text(f"Total current orbs: &{sum([orb.count for orb in orbs])}&")
+        helper.colored_text(f"Total current types: &{len(orbs)}&")
         print("Current Orbs:")
-        for orb in self.orbs.values():
+        for orb in orbs:
             helper.colored_text(f"&{orb.count}& {orb.orb.to_colortext()}")
 
-    def sort_orbs(self):
+    def sort_orbs(self) -> list[SaveOrb]:
         """Sort the orbs by attribute, effect, grade and id in that order with attribute being the most important"""
-        orbs = list(self.orbs.values())
-        orbs.sort(key=lambda orb: orb.orb.raw_orb_info.orb_id)
-        orbs.sort(key=lambda orb: orb.orb.raw_orb_info.grade_id)
-        orbs.sort(key=lambda orb: orb.orb.raw_orb_info.effect_id)
-        orbs.sort(key=lambda orb: orb.orb.raw_orb_info.attribute_id)
+        return sorted(
+            self.orbs.values(), key=lambda orb: orb.orb.raw_orb_info.get_sort_key()
+        )
 
     def edit(self):
         """Edit the orbs"""
@@ -431,10 +435,7 @@ If you want to do &multiple selections& then separate them with a &comma& like t
             orb_selection.extend(orbs)
 
         orb_selection = list(set(orb_selection))
-        orb_selection.sort(key=lambda orb: orb.raw_orb_info.orb_id)
-        orb_selection.sort(key=lambda orb: orb.raw_orb_info.grade_id)
-        orb_selection.sort(key=lambda orb: orb.raw_orb_info.effect_id)
-        orb_selection.sort(key=lambda orb: orb.raw_orb_info.attribute_id)
+        orb_selection.sort(key=lambda orb: orb.raw_orb_info.get_sort_key())
 
         print("Selected orbs:")
         for orb in orb_selection:
@@ -1,7 +1,6 @@
 """Handler for selecting cat ids"""
 
 import os
-from multiprocessing import Process
 from typing import Any, Callable, Optional
 
 
@@ -244,18 +243,6 @@ def search_cat_names(
     return found_names
 
 
-def download_10_files(game_version: str, file_names: list[str]) -> None:
-    """
-    Download 10 files
-
-    Args:
-        game_version (str): game version
-        file_names (list[str]): file names
-    """
-    for file_name in file_names:
-        game_data_getter.download_file(game_version, "resLocal", file_name, False)
-
-
 def get_cat_names(save_stats: dict[str, Any]) -> Optional[list[tuple[str, int, int]]]:
     """
     Get cat names and ids
@@ -268,47 +255,52 @@ def get_cat_names(save_stats: dict[str, Any]) -> Optional[list[tuple[str, int, i
     """
 
     is_jp = helper.is_jp(save_stats)
+    lang = helper.get_lang(is_jp)
+    delimeter = helper.get_text_splitter(is_jp)
 
     path = game_data_getter.get_path("resLocal", "", is_jp)
     if path is None:
         helper.colored_text("Failed to get cat names", helper.RED)
         return None
     file_path_dir = os.path.dirname(helper.get_file(path))
-    helper.create_dirs(file_path_dir)
-    if len(helper.find_files_in_dir(file_path_dir, "Unit_Explanation")) < len(
-        save_stats["cats"]
-    ):
+    downloaded: set[str] = set()
+    if os.path.isdir(file_path_dir):
+        downloaded = set(helper.find_files_in_dir(file_path_dir, "Unit_Explanation"))
+    all_file_names = [
+        f"Unit_Explanation{cat_id+1}_{lang}.csv"
+        for cat_id in range(len(save_stats["cats"]))
+    ]
+    missing_file_names = [
+        file_name for file_name in all_file_names if file_name not in downloaded
+    ]
+    failed_file_names: set[str] = set()
+    if missing_file_names:
         helper.colored_text(
             "Downloading cat names for the first time... (This may take some time, but next time it will be much faster)",
             helper.GREEN,
         )
-        funcs: list[Process] = []
         version = game_data_getter.get_latest_version(is_jp)
         if version is None:
             helper.colored_text("Failed to get cat names", helper.RED)
             return None
-        all_file_names: list[str] = []
-        for cat_id, _ in enumerate(save_stats["cats"]):
-            file_name = f"Unit_Explanation{cat_id+1}_{helper.get_lang(is_jp)}.csv"
-            all_file_names.append(file_name)
-        file_names_split = helper.chunks(all_file_names, 10)
-        for file_names in file_names_split:
-            funcs.append(
-                Process(
-                    target=download_10_files,
-                    args=(version, file_names),
-                )
+        failed_file_names = set(
+            game_data_getter.download_files(version, "resLocal", missing_file_names)
+        )
+        if failed_file_names:
+            helper.colored_text(
+                f"Failed to download names for &{len(failed_file_names)}& cats",
+                helper.RED,
+                helper.WHITE,
             )
-        helper.run_in_parallel(funcs)
 
     names: list[tuple[str, int, int]] = []
-    for cat_id, _ in enumerate(save_stats["cats"]):
-        file_path = os.path.join(
-            file_path_dir, f"Unit_Explanation{cat_id+1}_{helper.get_lang(is_jp)}.csv"
-        )
+    for cat_id, file_name in enumerate(all_file_names):
+        if file_name in failed_file_names:
+            continue
+        file_path = os.path.join(file_path_dir, file_name)
         data = csv_handler.parse_csv(
             helper.read_file_string(file_path),
-            delimeter=helper.get_text_splitter(is_jp),
+            delimeter=delimeter,
         )
         for form_id, form in enumerate(data):
             name = form[0]
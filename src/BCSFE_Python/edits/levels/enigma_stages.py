@@ -26,13 +26,14 @@ def edit_enigma_stages(save_stats: dict[str, Any]) -> dict[str, Any]:
     level = 3
 
     base_level = 25000
+    start_time = int(time.time())
     for enigma_id in ids:
         abs_id = enigma_id + base_level
         data: dict[str, int] = {}
         data["level"] = level
         data["stage_id"] = abs_id
         data["decoding_status"] = 2
-        data["start_time"] = int(time.time())
+        data["start_time"] = start_time
         enigma_stages["stages"].append(data)
 
     save_stats["enigma_data"] = enigma_stages
@@ -70,6 +70,7 @@ def set_medals(
         return stage_stats, medal_stats
 
     unlock_next = stage_stats["Value"]["unlock_next"]
+    obtained = set(medal_stats["medal_data_1"])
 
     for medal in medal_data.stages:
         if not medal.maps:
@@ -90,8 +91,9 @@ def set_medals(
                 completed = False
                 break
         if completed:
-            if medal.medal_id not in medal_stats["medal_data_1"]:
+            if medal.medal_id not in obtained:
                 medal_stats["medal_data_1"].append(medal.medal_id)
+                obtained.add(medal.medal_id)
             medal_stats["medal_data_2"][medal.medal_id] = 1
     return stage_stats, medal_stats
 
@@ -31,13 +31,15 @@ def get_medal_names(is_jp: bool) -> Optional[list[str]]:
 def set_medals(medal_stats: dict[str, Any], ids: list[int]) -> dict[str, Any]:
     """Set the medal stats of a set of medals"""
 
+    obtained = set(medal_stats["medal_data_1"])
     for medal_id in ids:
         if medal_id == 0:
             continue
         medal_id -= 1
-        if medal_id not in medal_stats["medal_data_1"]:
+        if medal_id not in obtained:
             if medal_id not in medal_stats["medal_data_2"]:
                 medal_stats["medal_data_1"].append(medal_id)
+                obtained.add(medal_id)
             medal_stats["medal_data_2"][medal_id] = 0
     return medal_stats
 
@@ -45,14 +47,17 @@ def set_medals(medal_stats: dict[str, Any], ids: list[int]) -> dict[str, Any]:
 def remove_medals(medal_stats: dict[str, Any], ids: list[int]) -> dict[str, Any]:
     """Remove the medal stats of a set of medals"""
 
+    removed: set[int] = set()
     for medal_id in ids:
         if medal_id == 0:
             continue
         medal_id -= 1
-        if medal_id in medal_stats["medal_data_1"]:
-            medal_stats["medal_data_1"].remove(medal_id)
+        removed.add(medal_id)
         if medal_id in medal_stats["medal_data_2"]:
             medal_stats["medal_data_2"].pop(medal_id)
+    medal_stats["medal_data_1"] = [
+        medal_id for medal_id in medal_stats["medal_data_1"] if medal_id not in removed
+    ]
     return medal_stats
 
 
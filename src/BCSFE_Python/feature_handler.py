@@ -194,52 +194,53 @@ def show_options(
 ) -> dict[str, Any]:
     """Allow the user to either enter a feature number or a feature name, and get the features that match"""
 
-    if (
-        not config_manager.get_config_value_category("EDITOR", "SHOW_CATEGORIES")
-        and FEATURES == features_to_use
-    ):
-        user_input = ""
-    else:
-        prompt = (
-            "What do you want to edit (some options contain other features within them)"
-        )
-        if config_manager.get_config_value_category(
-            "EDITOR", "SHOW_FEATURE_SELECT_EXPLANATION"
+    while True:
+        if (
+            not config_manager.get_config_value_category("EDITOR", "SHOW_CATEGORIES")
+            and FEATURES == features_to_use
         ):
-            prompt += "\nYou can enter a number to run a feature or a word to search for that feature (e.g entering catfood will run the Cat Food feature, and entering tickets will show you all the features that edit tickets)\nYou can press enter to see a list of all of the features"
-        user_input = user_input_handler.colored_input(f"{prompt}:\n")
-    user_int = helper.check_int(user_input)
-    results = []
-    if user_int is None:
-        results = get_feature(features_to_use, user_input, {})
-    else:
-        if user_int < 1 or user_int > len(features_to_use) + 1:
-            helper.colored_text("Value out of range", helper.RED)
-            return show_options(save_stats, features_to_use)
-        if FEATURES != features_to_use:
-            if user_int - 2 < 0:
-                return menu(save_stats)
-            results = features_to_use[list(features_to_use)[user_int - 2]]
+            user_input = ""
         else:
-            results = features_to_use[list(features_to_use)[user_int - 1]]
-    if not isinstance(results, dict):
-        save_stats_return = results(save_stats)
-        if save_stats_return is None:
-            return save_stats
-        return save_stats_return
-    if len(results) == 0:
-        helper.colored_text("No feature found with that name.", helper.RED)
-        return menu(save_stats)
-    if len(results) == 1 and isinstance(list(results.values())[0], dict):
-        results = results[list(results)[0]]
-    if len(results) == 1:
-        save_stats_return = results[list(results)[0]](save_stats)
-        if save_stats_return is None:
-            return save_stats
-        return save_stats_return
+            prompt = (
+                "What do you want to edit (some options contain other features within them)"
+            )
+            if config_manager.get_config_value_category(
+                "EDITOR", "SHOW_FEATURE_SELECT_EXPLANATION"
+            ):
+                prompt += "\nYou can enter a number to run a feature or a word to search for that feature (e.g entering catfood will run the Cat Food feature, and entering tickets will show you all the features that edit tickets)\nYou can press enter to see a list of all of the features"
+            user_input = user_input_handler.colored_input(f"{prompt}:\n")
+        user_int = helper.check_int(user_input)
+        results = []
+        if user_int is None:
+            results = get_feature(features_to_use, user_input, {})
+        else:
+            if user_int < 1 or user_int > len(features_to_use) + 1:
+                helper.colored_text("Value out of range", helper.RED)
+                continue
+            if FEATURES != features_to_use:
+                if user_int - 2 < 0:
+                    return menu(save_stats)
+                results = features_to_use[list(features_to_use)[user_int - 2]]
+            else:
+                results = features_to_use[list(features_to_use)[user_int - 1]]
+        if not isinstance(results, dict):
+            save_stats_return = results(save_stats)
+            if save_stats_return is None:
+                return save_stats
+            return save_stats_return
+        if len(results) == 0:
+            helper.colored_text("No feature found with that name.", helper.RED)
+            return menu(save_stats)
+        if len(results) == 1 and isinstance(list(results.values())[0], dict):
+            results = results[list(results)[0]]
+        if len(results) == 1:
+            save_stats_return = results[list(results)[0]](save_stats)
+            if save_stats_return is None:
+                return save_stats
+            return save_stats_return
 
-    helper.colored_list(["Go Back"] + list(results))
-    return show_options(save_stats, results)
+        helper.colored_list(["Go Back"] + list(results))
+        features_to_use = results
 
 
 def menu(
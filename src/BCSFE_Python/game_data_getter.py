@@ -1,11 +1,77 @@
 """Get game data from the BCData GitHub repository."""
+import concurrent.futures
+import functools
 import os
+import threading
+import time
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 from . import helper
 
 URL = "https://raw.githubusercontent.com/fieryhenry/BCData/master/"
+MAX_DOWNLOAD_WORKERS = 32
+VERSIONS_TTL = 300
+
+versions_cache: Optional[tuple[float, list[str], Optional[str]]] = None
+
+session: Optional[requests.Session] = None
+session_lock = threading.Lock()
+
+created_dirs: set[str] = set()
+created_dirs_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Gets the shared session so downloads reuse connections to the BCData host.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global session
+    with session_lock:
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        return session
+
+
+@functools.lru_cache(maxsize=None)
+def get_pack_dir(game_version: str, pack_name: str) -> str:
+    """
+    Gets the folder that the files of a pack are stored in.
+
+    Args:
+        game_version (str): The game version of the pack.
+        pack_name (str): The pack name.
+
+    Returns:
+        str: The path of the folder.
+    """
+    return helper.get_file(os.path.join("game_data", game_version, pack_name))
+
+
+def ensure_pack_dir(game_version: str, pack_name: str) -> str:
+    """
+    Creates the folder of a pack, only touching the disk the first time.
+
+    Args:
+        game_version (str): The game version of the pack.
+        pack_name (str): The pack name.
+
+    Returns:
+        str: The path of the folder.
+    """
+    path = get_pack_dir(game_version, pack_name)
+    with created_dirs_lock:
+        if path not in created_dirs:
+            helper.create_dirs(path)
+            created_dirs.add(path)
+    return path
 
 
 def download_file(
@@ -14,7 +80,7 @@ def download_file(
     file_name: str,
     get_data: bool = True,
     print_progress: bool = True,
-) -> bytes:
+) -> Optional[bytes]:
     """
     Downloads the file.
 
@@ -26,14 +92,17 @@ def download_file(
         print_progress (bool, optional): Whether to print the progress. Defaults to True.
 
     Returns:
-        bytes: The data of the file.
+        Optional[bytes]: The data of the file, None if it could not be downloaded.
     """
 
-    path = helper.get_file(os.path.join("game_data", game_version, pack_name))
+    path = get_pack_dir(game_version, pack_name)
     file_path = os.path.join(path, file_name)
-    if os.path.exists(file_path):
-        if get_data:
+    if get_data:
+        try:
             return helper.read_file_bytes(file_path)
+        except FileNotFoundError:
+            pass
+    elif os.path.exists(file_path):
         return b""
 
     if print_progress:
@@ -43,13 +112,90 @@ def download_file(
             helper.WHITE,
         )
     url = URL + game_version + "/" + pack_name + "/" + file_name
-    response = requests.get(url)
+    ensure_pack_dir(game_version, pack_name)
+    if not get_data:
+        stream_to_file(url, file_path)
+        return b""
 
-    helper.create_dirs(path)
+    try:
+        response = get_session().get(url)
+    except requests.exceptions.ConnectionError:
+        return None
+    if response.status_code != 200:
+        return None
     helper.write_file_bytes(file_path, response.content)
     return response.content
 
 
+def stream_to_file(url: str, file_path: str, chunk_size: int = 64 * 1024) -> None:
+    """
+    Downloads a file straight to disk without holding all of it in memory.
+
+    Args:
+        url (str): The url to download.
+        file_path (str): The path to save the file to.
+        chunk_size (int, optional): The size of each chunk written. Defaults to 64KB.
+    """
+    temp_path = file_path + ".part"
+    with get_session().get(url, stream=True) as response:
+        response.raise_for_status()
+        try:
+            with open(temp_path, "wb") as file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    os.replace(temp_path, file_path)
+
+
+def download_files(
+    game_version: str,
+    pack_name: str,
+    file_names: list[str],
+    print_progress: bool = True,
+    max_workers: int = MAX_DOWNLOAD_WORKERS,
+) -> list[str]:
+    """
+    Downloads several files at once, sharing the session's connections.
+
+    Args:
+        game_version (str): The game version to download from.
+        pack_name (str): The pack name to download from.
+        file_names (list[str]): The file names to download.
+        print_progress (bool, optional): Whether to print the progress. Defaults to True.
+        max_workers (int, optional): The most files to download at once. Defaults to MAX_DOWNLOAD_WORKERS.
+
+    Returns:
+        list[str]: The file names that failed to download.
+    """
+    path = get_pack_dir(game_version, pack_name)
+    missing_file_names = [
+        file_name
+        for file_name in file_names
+        if not os.path.exists(os.path.join(path, file_name))
+    ]
+    if not missing_file_names:
+        return []
+    ensure_pack_dir(game_version, pack_name)
+    max_workers = min(max_workers, len(missing_file_names))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                download_file, game_version, pack_name, file_name, False, print_progress
+            )
+            for file_name in missing_file_names
+        ]
+        failed_file_names: list[str] = []
+        for file_name, future in zip(missing_file_names, futures):
+            try:
+                future.result()
+            except requests.exceptions.RequestException:
+                failed_file_names.append(file_name)
+    return failed_file_names
+
+
 def get_latest_versions() -> Optional[list[str]]:
     """
     Gets the latest versions of the game data.
@@ -57,14 +203,36 @@ def get_latest_versions() -> Optional[list[str]]:
     Returns:
         Optional[list[str]]: The latest versions of the game data.
     """
+    global versions_cache
+    headers: dict[str, str] = {}
+    if versions_cache is not None:
+        fetched_at, versions, etag = versions_cache
+        if time.monotonic() - fetched_at < VERSIONS_TTL:
+            return versions
+        if etag is not None:
+            headers["If-None-Match"] = etag
     try:
-        response = requests.get(URL + "latest.txt")
+        response = get_session().get(URL + "latest.txt", headers=headers)
     except requests.exceptions.ConnectionError:
         return None
-    versions = response.text.splitlines()
+    if response.status_code == 304 and versions_cache is not None:
+        versions = versions_cache[1]
+    elif response.status_code == 200:
+        versions = response.text.splitlines()
+    else:
+        return None
+    versions_cache = (time.monotonic(), versions, response.headers.get("ETag"))
     return versions
 
 
+def clear_versions_cache() -> None:
+    """
+    Forgets the cached latest versions so the next lookup fetches them again.
+    """
+    global versions_cache
+    versions_cache = None
+
+
 def get_latest_version(is_jp: bool) -> Optional[str]:
     """
     Gets the latest version of the game data.
@@ -78,10 +246,10 @@ def get_latest_version(is_jp: bool) -> Optional[str]:
     versions = get_latest_versions()
     if versions is None:
         return None
-    if is_jp:
-        return versions[1]
-    else:
-        return versions[0]
+    index = 1 if is_jp else 0
+    if index >= len(versions):
+        return None
+    return versions[index]
 
 
 def get_file_latest(pack_name: str, file_name: str, is_jp: bool) -> Optional[bytes]:
@@ -147,6 +315,8 @@ def check_remove(new_version: str, is_jp: bool):
         is_jp (bool): Whether to get the japanese version.
     """
     all_versions = helper.get_dirs(helper.get_file("game_data"))
+    with created_dirs_lock:
+        created_dirs.clear()
     for version in all_versions:
         if is_jp:
             if "jp" not in version:
@@ -165,8 +335,7 @@ def check_remove_handler():
     Checks if older game data is downloaded, and deletes if out of date.
     """
 
-    versions = get_latest_versions()
-    if versions is None:
-        return None
-    check_remove(versions[0], is_jp=False)
-    check_remove(versions[1], is_jp=True)
+    for is_jp in (False, True):
+        version = get_latest_version(is_jp)
+        if version is not None:
+            check_remove(version, is_jp=is_jp)
@@ -1,9 +1,11 @@
 """Helper script for usefull functions"""
 
 import filecmp
+import functools
 import json
 from multiprocessing import Process
 import os
+import re
 import shutil
 import sys
 import time
@@ -27,6 +29,8 @@ BLACK = "#000000"
 WHITE = "#FFFFFF"
 CYAN = "#00FFFF"
 
+INT_TOKEN = re.compile(r"(?<!\S)[-+]?\d+(?!\S)")
+
 
 def get_time() -> int:
     """Get current time in seconds"""
@@ -74,8 +78,7 @@ def delete_dir(path: str) -> None:
 def create_dirs(path: str) -> None:
     """Create directories if they don't exist"""
 
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
 
 
 def offset_list(lst: list[int], offset: int) -> list[int]:
@@ -250,10 +253,20 @@ def parse_int_list(lst: list[str], offset: int) -> list[int]:
     return new_list
 
 
+def parse_int_str(text: str, offset: int) -> list[int]:
+    """Turn a space separated string of ints to an int list, skipping invalid ones"""
+
+    return [int(item) + offset for item in INT_TOKEN.findall(text)]
+
+
 def clamp(value: int, min_value: int, max_value: int) -> int:
     """Clamp a value between two values"""
 
-    return max(min(value, max_value), min_value)
+    if value > max_value:
+        value = max_value
+    if value < min_value:
+        return min_value
+    return value
 
 
 def write_file_bytes(file_path: str, data: bytes) -> bytes:
@@ -539,32 +552,53 @@ def is_android() -> bool:
     return "ANDROID_ROOT" in os.environ
 
 
-def colored_text(
+@functools.lru_cache(maxsize=None)
+def get_fg_color(color: str) -> str:
+    """Get the escape code for a foreground color, hex colors are slow to convert"""
+
+    return colored.fg(color)  # type: ignore
+
+
+def get_colored_text(
     text: str,
     base: str = WHITE,
     new: str = DARK_YELLOW,
     split_char: str = "&",
-    end: str = "\n",
-):
-    """Print text with colors"""
-    color_new = colored.fg(new)  # type: ignore
-    color_base = colored.fg(base)  # type: ignore
-    color_reset = colored.fg(WHITE)  # type: ignore
+) -> str:
+    """Get text with color escape codes so it can be printed more than once"""
+    color_new = get_fg_color(new)
+    color_base = get_fg_color(base)
+    color_reset = get_fg_color(WHITE)
 
     text_split: list[str] = split_text(text, split_char)
+    sections: list[str] = []
     for i, text_section in enumerate(text_split):
         if i % 2:
-            print(f"{color_new}{text_section}{color_base}", end="")
+            sections.append(f"{color_new}{text_section}{color_base}")
         else:
-            print(f"{color_base}{text_section}{color_base}", end="")
-    print(color_reset, end=end)
+            sections.append(f"{color_base}{text_section}{color_base}")
+    sections.append(color_reset)
+    return "".join(sections)
+
+
+def colored_text(
+    text: str,
+    base: str = WHITE,
+    new: str = DARK_YELLOW,
+    split_char: str = "&",
+    end: str = "\n",
+):
+    """Print text with colors"""
+    print(get_colored_text(text, base, new, split_char), end=end)
 
 
 def split_text(text: str, split_char: str = "&") -> list[str]:
     """Split text on split_char, allowing for escaped split chars"""
 
+    if "\\" not in text:
+        return text.split(split_char)
     text_split: list[str] = []
-    current_string = ""
+    current_string: list[str] = []
     skip = 0
     for i, char in enumerate(text):
         if skip > 0:
@@ -572,15 +606,15 @@ def split_text(text: str, split_char: str = "&") -> list[str]:
             continue
         if char == "\\":
             if text[i + 1] == split_char:
-                current_string += split_char
+                current_string.append(split_char)
                 skip = 1
                 continue
         if char == split_char:
-            text_split.append(current_string)
-            current_string = ""
+            text_split.append("".join(current_string))
+            current_string = []
         else:
-            current_string += char
-    text_split.append(current_string)
+            current_string.append(char)
+    text_split.append("".join(current_string))
     return text_split
 
 
@@ -592,20 +626,17 @@ def colored_list(
 ):
     """Print a list with colors and extra data if provided"""
 
-    final = ""
+    lines: list[str] = []
     for i, item in enumerate(items):
-        if index:
-            final += f"{i+1}. "
-        final += f"&{item}&"
+        line = f"{i+1}. &{item}&" if index else f"&{item}&"
         if extra_data:
             if extra_data[i] is not None:
                 if isinstance(offset, int) and isinstance(extra_data[i], int):
-                    final += f" &:& {extra_data[i]+offset}"
+                    line += f" &:& {extra_data[i]+offset}"
                 else:
-                    final += f" &:& {extra_data[i]}"
-        final += "\n"
-    final = final.rstrip("\n")
-    colored_text(final)
+                    line += f" &:& {extra_data[i]}"
+        lines.append(line)
+    colored_text("\n".join(lines))
 
 
 def calculate_user_rank(save_stats: dict[str, Any]):
@@ -693,21 +724,6 @@ def setup_tk() -> Any:
     return root
 
 
-def run_in_parallel(fns: list[Process]) -> None:
-    """
-    Run a list of functions in parallel
-
-    Args:
-        fns (list[Process]): List of functions to run in parallel
-    """
-    proc: list[Process] = []
-    for fn in fns:
-        fn.start()
-        proc.append(fn)
-    for p in proc:
-        p.join()
-
-
 def run_in_background(func: Callable[..., Any]) -> None:
     """
     Run a function in the background
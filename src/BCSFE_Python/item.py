@@ -1,3 +1,4 @@
+import functools
 from typing import Optional, Union
 from . import (
     managed_item,
@@ -28,9 +29,14 @@ class Int:
         self.signed = signed
 
     def get_max_value(self) -> int:
-        if self.signed:
-            return (2 ** (self.byte_size * 8 - 1)) - 1
-        return (2 ** (self.byte_size * 8)) - 1
+        return Int.calc_max_value(self.byte_size, self.signed)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def calc_max_value(byte_size: int, signed: bool) -> int:
+        if signed:
+            return (2 ** (byte_size * 8 - 1)) - 1
+        return (2 ** (byte_size * 8)) - 1
 
 
 class IntItem:
@@ -34,7 +34,18 @@ class PropertySet:
 
 
 class LocalManager:
+    instances: dict[str, "LocalManager"] = {}
+
+    def __new__(cls, locale: str) -> "LocalManager":
+        instance = cls.instances.get(locale)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls.instances[locale] = instance
+        return instance
+
     def __init__(self, locale: str):
+        if getattr(self, "loaded", False):
+            return
         self.locale = locale
         self.path = os.path.join(helper.get_local_files_path(), "locales", locale)
         if not os.path.exists(self.path):
@@ -46,7 +57,9 @@ class LocalManager:
             if not os.path.exists(self.en_path):
                 os.makedirs(self.en_path)
             self.en_properties: dict[str, PropertySet] = {}
+        self.key_cache: dict[str, str] = {}
         self.parse()
+        self.loaded = True
 
     def parse(self):
         for file in helper.get_files_in_dir(self.path):
@@ -67,6 +80,9 @@ class LocalManager:
         return self.properties[property].get_key(key)
 
     def search_key(self, key: str) -> str:
+        cached = self.key_cache.get(key)
+        if cached is not None:
+            return cached
         value = None
         for prop in self.properties.values():
             if key in prop.properties:
@@ -88,6 +104,7 @@ class LocalManager:
             value = value.replace(
                 value[start : end + 2], self.search_key(value[start + 2 : end])
             )
+        self.key_cache[key] = value
         return value
 
     @staticmethod
@@ -1247,16 +1247,24 @@ def get_enigma_stages() -> dict[str, Any]:
     enigma_data["unknown_3"] = next_int(1)
 
     total_stages = next_int(1)
+    if save_data_g is None:
+        raise Exception("No save data loaded")
+    # level (4), stage_id (4), decoding_status (1), start_time (double)
+    stage_size = struct.calcsize("<IIBd")
+    stage_data = save_data_g[address : address + total_stages * stage_size]
     stages: list[dict[str, Any]] = []
-    for _ in range(total_stages):
+    for level, stage_id, decoding_status, start_time in struct.iter_unpack(
+        "<IIBd", stage_data
+    ):
         data = {}
-        data["level"] = next_int(4)  # 0 = inferior, 1 = normal, 2 = superior
-        data["stage_id"] = next_int(4)
-        data["decoding_status"] = next_int(
-            1
-        )  # 0 = not decoded, 1 = decoded, 2 = revealed
-        data["start_time"] = get_double()
+        data["level"] = level  # 0 = inferior, 1 = normal, 2 = superior
+        data["stage_id"] = stage_id
+        data["decoding_status"] = (
+            decoding_status  # 0 = not decoded, 1 = decoded, 2 = revealed
+        )
+        data["start_time"] = start_time
         stages.append(data)
+    set_address(address + total_stages * stage_size)
     enigma_data["stages"] = stages
     return enigma_data
 
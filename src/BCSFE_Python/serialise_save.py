@@ -745,10 +745,13 @@ def serialise_enigma_data(save_data: list[int], enigma_data: dict[str, Any]):
 
     save_data = write(save_data, len(enigma_data["stages"]), 1)
     for stage in enigma_data["stages"]:
-        save_data = write(save_data, stage["level"], 4)
-        save_data = write(save_data, stage["stage_id"], 4)
-        save_data = write(save_data, stage["decoding_status"], 1)
-        save_data = write_double(save_data, stage["start_time"])
+        save_data += struct.pack(
+            "<IIBd",
+            int(stage["level"]),
+            int(stage["stage_id"]),
+            int(stage["decoding_status"]),
+            float(stage["start_time"]),
+        )
 
     return save_data
 
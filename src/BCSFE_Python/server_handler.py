@@ -20,6 +20,17 @@ from . import (
     parse_save,
 )
 
+session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Get the shared session so requests to the ponos servers reuse connections."""
+
+    global session
+    if session is None:
+        session = requests.Session()
+    return session
+
 
 def get_current_time() -> int:
     """Get current time."""
@@ -155,9 +166,9 @@ def handle_request(
 
     try:
         if is_get:
-            response = requests.get(url, data=data, headers=headers)
+            response = get_session().get(url, data=data, headers=headers)
         else:
-            response = requests.post(url, data=data, headers=headers)
+            response = get_session().post(url, data=data, headers=headers)
     except requests.exceptions.RequestException as err:
         raise Exception("Error getting password: " + str(err)) from err
 
@@ -284,7 +295,7 @@ def download_save(
         "user-agent": "Dalvik/2.1.0 (Linux; U; Android 9; SM-G955F Build/N2G48B)",
     }
     try:
-        response = requests.post(url, data=data_s, headers=headers)
+        response = get_session().post(url, data=data_s, headers=headers)
     except requests.exceptions.RequestException as err:
         raise Exception("Error getting save: " + str(err)) from err
     return response
@@ -437,7 +448,7 @@ def upload_save_data_v2(
         "user-agent": "Dalvik/2.1.0 (Linux; U; Android 9; SM-G955F Build/N2G48B)",
     }
 
-    response = requests.post(url, data=body, headers=headers)
+    response = get_session().post(url, data=body, headers=headers)
     if response.status_code != 204:
         return None
 
@@ -479,7 +490,7 @@ def upload_metadata_v2(
         "user-agent": "Dalvik/2.1.0 (Linux; U; Android 9; SM-G955F Build/N2G48B)",
     }
 
-    response = requests.post(url, data=body, headers=headers)
+    response = get_session().post(url, data=body, headers=headers)
     if response.status_code != 204:
         return None
 
@@ -562,7 +573,7 @@ def get_inquiry_code() -> str:
     """Returns a new inquiry code"""
 
     url = get_nyanko_backups_url() + "/?action=createAccount&referenceId="
-    response = requests.get(url)
+    response = get_session().get(url)
     data = response.json()
     return data["accountId"]
 
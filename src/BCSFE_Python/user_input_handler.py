@@ -74,9 +74,10 @@ def get_range(
 ) -> list[int]:
     """Get a range of numbers from user input"""
     locale_manager = locale_handler.LocalManager.from_config()
+    all_text = locale_manager.search_key("all_text").lower()
     ids: list[int] = []
     for item in usr_input.split(" "):
-        if item.lower() == locale_manager.search_key("all_text").lower():
+        if item.lower() == all_text:
             if length is None and all_ids is None:
                 helper.colored_text(
                     locale_manager.search_key("invalid_all"), helper.RED
@@ -118,7 +119,12 @@ def colored_input(
         base = helper.WHITE
     if new is None:
         new = helper.DARK_YELLOW
-    helper.colored_text(dialog, end="", base=base, new=new)
+    return rendered_input(helper.get_colored_text(dialog, base=base, new=new))
+
+
+def rendered_input(dialog: str) -> str:
+    """Get user input for a dialog already colored by helper.get_colored_text"""
+    print(dialog, end="")
     return input()
 
 
@@ -148,27 +154,27 @@ def select_options(
     if mode is None:
         mode = locale_manager.search_key("edit_text")
 
-    helper.colored_list(options, extra_data=extra_data, offset=offset)
     total = len(options)
-    helper.colored_text(f"{total+1}. {locale_manager.search_key('select_all')}")
-    ids_s = colored_input(
+    select_all = f"{total+1}. {locale_manager.search_key('select_all')}"
+    select_list = helper.get_colored_text(
         locale_manager.search_key("select_list") % (mode, mode)
-    ).split(" ")
-    individual = True
-    if str(total + 1) in ids_s:
-        ids = list(range(1, total + 1))
-        individual = False
-        ids_s = helper.int_to_str_ls(ids)
-
-    ids = helper.parse_int_list(ids_s, -1)
-    for item_id in ids:
-        if item_id < 0 or item_id > total - 1:
-            helper.colored_text(
-                locale_manager.search_key("invalid_range") % (total + 1),
-                helper.RED,
-            )
-            return select_options(options, mode, extra_data, offset)
-    return ids, individual
+    )
+    invalid_range = locale_manager.search_key("invalid_range") % (total + 1)
+    while True:
+        helper.colored_list(options, extra_data=extra_data, offset=offset)
+        helper.colored_text(select_all)
+        ids = helper.parse_int_str(rendered_input(select_list), -1)
+        individual = True
+        if total in ids:
+            ids = list(range(total))
+            individual = False
+
+        for item_id in ids:
+            if item_id < 0 or item_id > total - 1:
+                helper.colored_text(invalid_range, helper.RED)
+                break
+        else:
+            return ids, individual
 
 
 def select_inc(
@@ -204,24 +210,25 @@ def select_single(
         raise ValueError(locale_manager.search_key("error_no_options"))
     if len(options) == 1:
         return 1
-    helper.colored_list(options)
     if not title:
         title = locale_manager.search_key("select_option_to") % (mode)
-    val = colored_input(title)
-    if allow_text:
-        if val in options:
-            return options.index(val) + 1
-    val = helper.check_int(val)
-    if val is None:
-        helper.colored_text(locale_manager.search_key("invalid_int"), helper.RED)
-        return select_single(options, mode, title, allow_text)
-    if val < 1 or val > len(options):
-        helper.colored_text(
-            locale_manager.search_key("invalid_range") % (len(options)),
-            helper.RED,
-        )
-        return select_single(options, mode, title, allow_text)
-    return val
+    prompt = helper.get_colored_text(title)
+    invalid_int = locale_manager.search_key("invalid_int")
+    invalid_range = locale_manager.search_key("invalid_range") % (len(options))
+    while True:
+        helper.colored_list(options)
+        val = rendered_input(prompt)
+        if allow_text:
+            if val in options:
+                return options.index(val) + 1
+        val = helper.check_int(val)
+        if val is None:
+            helper.colored_text(invalid_int, helper.RED)
+            continue
+        if val < 1 or val > len(options):
+            helper.colored_text(invalid_range, helper.RED)
+            continue
+        return val
 
 
 def get_int(dialog: str, default: Optional[int] = None) -> int:
@@ -229,6 +236,7 @@ def get_int(dialog: str, default: Optional[int] = None) -> int:
 
     helper.colored_text(dialog, end="")
     locale_manager = locale_handler.LocalManager.from_config()
+    invalid_int = locale_manager.search_key("invalid_int")
     while True:
         try:
             val = input()
@@ -237,7 +245,7 @@ def get_int(dialog: str, default: Optional[int] = None) -> int:
         except ValueError:
             if default is not None:
                 return default
-            helper.colored_text(locale_manager.search_key("invalid_int"), helper.RED)
+            helper.colored_text(invalid_int, helper.RED)
 
 
 def ask_if_individual(item_name: str) -> bool:
@@ -255,11 +263,13 @@ def ask_if_individual(item_name: str) -> bool:
 def get_yes_no(dialog: str) -> bool:
     """Get user input as a yes or no"""
     locale_manager = locale_handler.LocalManager.from_config()
+    invalid_yes_no = locale_manager.search_key("invalid_yes_no")
+    prompt = helper.get_colored_text(dialog)
     while True:
-        val = colored_input(dialog)
+        val = rendered_input(prompt)
         if val:
             if val.lower()[0] == "y":
                 return True
             if val.lower()[0] == "n":
                 return False
-        helper.colored_text(locale_manager.search_key("invalid_yes_no"), helper.RED)
+        helper.colored_text(invalid_yes_no, helper.RED)
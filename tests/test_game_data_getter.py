@@ -0,0 +1,179 @@
+"""Test game data getter"""
+
+import os
+from typing import Any, Iterator, Optional
+
+import pytest
+import requests
+from pytest import MonkeyPatch
+from BCSFE_Python import game_data_getter
+
+
+class FakeResponse:
+    def __init__(self, text: str, status_code: int = 200, etag: str = ""):
+        self.text = text
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+
+
+class FakeStreamResponse:
+    def __init__(self, status_code: int = 200, fail: bool = False):
+        self.status_code = status_code
+        self.fail = fail
+        self.content = b"data" if status_code == 200 else b"404: Not Found"
+
+    def __enter__(self) -> "FakeStreamResponse":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        if self.status_code != 200:
+            raise requests.exceptions.HTTPError(str(self.status_code))
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        if self.fail:
+            yield b"partial"
+            raise requests.exceptions.ConnectionError()
+        yield self.content
+
+
+class FakeSession:
+    def __init__(self, text: str, etag: str = "", status_code: int = 200):
+        self.text = text
+        self.etag = etag
+        self.status_code = status_code
+        self.urls: list[str] = []
+        self.headers: list[dict[str, str]] = []
+
+    def get(
+        self, url: str, headers: Optional[dict[str, str]] = None, **_: Any
+    ) -> FakeResponse:
+        self.urls.append(url)
+        self.headers.append(headers or {})
+        if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+            return FakeResponse("", 304, self.etag)
+        return FakeResponse(self.text, self.status_code, self.etag)
+
+
+class FakeStreamSession:
+    def __init__(self, response: FakeStreamResponse):
+        self.response = response
+
+    def get(self, url: str, **_: Any) -> FakeStreamResponse:
+        return self.response
+
+
+class FakeFileSession:
+    def __init__(self, missing_file_names: list[str]):
+        self.missing_file_names = missing_file_names
+
+    def get(self, url: str, **_: Any) -> FakeStreamResponse:
+        if url.rsplit("/", 1)[-1] in self.missing_file_names:
+            return FakeStreamResponse(404)
+        return FakeStreamResponse()
+
+
+def test_latest_versions_cached(monkeypatch: MonkeyPatch):
+    """Test that latest.txt is only requested once while the cache is fresh"""
+    session = FakeSession("12.1.0\n12.1.0jp\n")
+    monkeypatch.setattr(game_data_getter, "get_session", lambda: session)
+    game_data_getter.clear_versions_cache()
+
+    assert game_data_getter.get_latest_version(False) == "12.1.0"
+    assert game_data_getter.get_latest_version(True) == "12.1.0jp"
+    assert len(session.urls) == 1
+
+    game_data_getter.clear_versions_cache()
+    game_data_getter.get_latest_versions()
+    assert len(session.urls) == 2
+    game_data_getter.clear_versions_cache()
+
+
+def test_latest_versions_error_not_cached(monkeypatch: MonkeyPatch):
+    """Test that an error response is not cached as the versions"""
+    session = FakeSession("Internal Server Error", status_code=500)
+    monkeypatch.setattr(game_data_getter, "get_session", lambda: session)
+    game_data_getter.clear_versions_cache()
+
+    assert game_data_getter.get_latest_versions() is None
+    session.text = "12.1.0\n12.1.0jp\n"
+    session.status_code = 200
+    assert game_data_getter.get_latest_versions() == ["12.1.0", "12.1.0jp"]
+    assert len(session.urls) == 2
+    game_data_getter.clear_versions_cache()
+
+
+def test_latest_version_missing(monkeypatch: MonkeyPatch):
+    """Test that a missing version line gives None instead of raising"""
+    session = FakeSession("12.1.0\n")
+    monkeypatch.setattr(game_data_getter, "get_session", lambda: session)
+    game_data_getter.clear_versions_cache()
+
+    assert game_data_getter.get_latest_version(False) == "12.1.0"
+    assert game_data_getter.get_latest_version(True) is None
+    game_data_getter.clear_versions_cache()
+
+
+def test_latest_versions_not_modified(monkeypatch: MonkeyPatch):
+    """Test that an expired cache is revalidated with its ETag"""
+    session = FakeSession("12.1.0\n12.1.0jp\n", etag='"abc"')
+    monkeypatch.setattr(game_data_getter, "get_session", lambda: session)
+    game_data_getter.clear_versions_cache()
+
+    assert game_data_getter.get_latest_versions() == ["12.1.0", "12.1.0jp"]
+    monkeypatch.setattr(game_data_getter, "VERSIONS_TTL", 0)
+    assert game_data_getter.get_latest_versions() == ["12.1.0", "12.1.0jp"]
+    assert session.headers[-1] == {"If-None-Match": '"abc"'}
+    game_data_getter.clear_versions_cache()
+
+
+def test_stream_to_file_failures(monkeypatch: MonkeyPatch, tmp_path: Any):
+    """Test that failed downloads leave neither the file nor its .part file"""
+    file_path = os.path.join(tmp_path, "Unit_Explanation1_en.csv")
+
+    monkeypatch.setattr(
+        game_data_getter,
+        "get_session",
+        lambda: FakeStreamSession(FakeStreamResponse(404)),
+    )
+    with pytest.raises(requests.exceptions.HTTPError):
+        game_data_getter.stream_to_file("url", file_path)
+    assert os.listdir(tmp_path) == []
+
+    monkeypatch.setattr(
+        game_data_getter,
+        "get_session",
+        lambda: FakeStreamSession(FakeStreamResponse(fail=True)),
+    )
+    with pytest.raises(requests.exceptions.ConnectionError):
+        game_data_getter.stream_to_file("url", file_path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_download_files_missing_file(monkeypatch: MonkeyPatch, tmp_path: Any):
+    """Test that a 404 for one file is reported instead of raised"""
+    monkeypatch.setattr(
+        game_data_getter,
+        "get_session",
+        lambda: FakeFileSession(["Unit_Explanation2_en.csv"]),
+    )
+    monkeypatch.setattr(game_data_getter, "get_pack_dir", lambda *_: str(tmp_path))
+
+    failed = game_data_getter.download_files(
+        "12.1.0",
+        "resLocal",
+        ["Unit_Explanation1_en.csv", "Unit_Explanation2_en.csv"],
+        False,
+    )
+    assert failed == ["Unit_Explanation2_en.csv"]
+    assert os.listdir(tmp_path) == ["Unit_Explanation1_en.csv"]
+
+    assert (
+        game_data_getter.download_file(
+            "12.1.0", "resLocal", "Unit_Explanation2_en.csv", True, False
+        )
+        is None
+    )
+    assert os.listdir(tmp_path) == ["Unit_Explanation1_en.csv"]
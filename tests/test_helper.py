@@ -17,3 +17,26 @@ def test_gv_to_str():
     assert helper.gv_to_str(110802) == "11.8.2"
     assert helper.gv_to_str(10700) == "1.7.0"
     assert helper.gv_to_str(108700) == "10.87.0"
+
+
+def test_parse_int_str():
+    """Test that only whole integer tokens are parsed and offset"""
+    assert helper.parse_int_str("1 2 3", -1) == [0, 1, 2]
+    assert helper.parse_int_str("  5   10 ", 0) == [5, 10]
+    assert helper.parse_int_str("4 abc 5a -2 +7", 0) == [4, -2, 7]
+    assert helper.parse_int_str("", 0) == []
+
+
+def test_clamp():
+    """Test that values are clamped between the min and max"""
+    assert helper.clamp(5, 0, 10) == 5
+    assert helper.clamp(-1, 0, 10) == 0
+    assert helper.clamp(11, 0, 10) == 10
+    assert helper.clamp(4, 5, 3) == 5
+
+
+def test_split_text():
+    """Test that text is split on the split char unless it is escaped"""
+    assert helper.split_text("a &b& c") == ["a ", "b", " c"]
+    assert helper.split_text("no colors") == ["no colors"]
+    assert helper.split_text("a \\&b\\& &c&") == ["a &b& ", "c", ""]
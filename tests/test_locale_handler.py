@@ -0,0 +1,41 @@
+"""Test locale handler"""
+
+from typing import Any
+
+import pytest
+from pytest import MonkeyPatch
+from BCSFE_Python import helper, locale_handler
+
+
+def test_local_manager_cached():
+    """Test that a locale is only loaded once"""
+    locale_manager = locale_handler.LocalManager("en")
+    assert locale_handler.LocalManager("en") is locale_manager
+
+
+def test_local_manager_failed_init(monkeypatch: MonkeyPatch, tmp_path: Any):
+    """Test that a locale that failed to load is loaded again next time"""
+    monkeypatch.setattr(helper, "get_local_files_path", lambda: str(tmp_path))
+
+    def fail_parse(_: locale_handler.LocalManager):
+        raise OSError()
+
+    monkeypatch.setattr(locale_handler.LocalManager, "parse", fail_parse)
+    with pytest.raises(OSError):
+        locale_handler.LocalManager("test")
+    monkeypatch.undo()
+    monkeypatch.setattr(helper, "get_local_files_path", lambda: str(tmp_path))
+
+    locale_manager = locale_handler.LocalManager("test")
+    assert locale_manager.loaded
+    assert locale_manager.key_cache == {}
+    locale_handler.LocalManager.instances.pop("test")
+
+
+def test_search_key_nested():
+    """Test that nested keys are resolved and cached"""
+    locale_manager = locale_handler.LocalManager("en")
+    value = locale_manager.search_key("invalid_int")
+    assert "{{" not in value
+    assert value.startswith(locale_manager.search_key("invalid_input"))
+    assert locale_manager.search_key("invalid_int") == value
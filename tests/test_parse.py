@@ -32,3 +32,35 @@ def run_testparse(file: str):
     save_stats = parse_save.parse_save(data_2, gv_c)
     data_3 = serialise_save.serialize_save(save_stats)
     assert data_2 == data_3 == data_1
+
+
+def test_enigma_stages_round_trip():
+    """Test that enigma stages serialise and parse back to the same values"""
+    enigma_data = {
+        "energy_since_1": 1000,
+        "energy_since_2": 2000,
+        "enigma_level": 3,
+        "unknown_2": 4,
+        "unknown_3": 5,
+        "stages": [
+            {
+                "level": 0,
+                "stage_id": 25000,
+                "decoding_status": 1,
+                "start_time": 1700000000.0,
+            },
+            {
+                "level": 2,
+                "stage_id": 25001,
+                "decoding_status": 2,
+                "start_time": 1700000123.5,
+            },
+        ],
+    }
+    save_data = serialise_save.serialise_enigma_data([], enigma_data)
+    assert len(save_data) == 12 + 2 * 17
+
+    parse_save.save_data_g = bytes(save_data)
+    parse_save.set_address(0)
+    assert parse_save.get_enigma_stages() == enigma_data
+    assert parse_save.address == 12 + 2 * 17